@@ -17,18 +17,16 @@ $Id:VAbenchmarks.py 5 2007-04-16 15:01:24Z davison $
 from __future__ import division
 from __future__ import print_function
 
-from past.utils import old_div
 import os
 import socket
-from math import *
 
 from pyNN.random import NumpyRNG, RandomDistribution
-from pyNN.utility import get_script_args, Timer
+from pyNN.utility import get_script_args, import_simulator, Timer
 usage = """Usage: python VAbenchmarks.py <simulator> <benchmark>
            <simulator> is either neuron, nest, brian or pcsim
            <benchmark> is either CUBA or COBA."""
-simulator_name, benchmark = get_script_args(2, usage)  
-exec("from pyNN.%s import *" % simulator_name)
+simulator_name, benchmark = get_script_args(2, usage)
+import_simulator(simulator_name, globals())
 
 timer = Timer()
 
@@ -80,9 +78,9 @@ Erev_inh = -80.   # (mV)
 
 area  = area*1e-8                     # convert to cm²
 cm    = cm*area*1000                  # convert to nF
-Rm    = old_div(1e-6,(g_leak*area))            # membrane resistance in MΩ
+Rm    = 1e-6/(g_leak*area)            # membrane resistance in MΩ
 assert tau_m == cm*Rm                 # just to check
-n_exc = int(round((old_div(n*r_ei,(1+r_ei))))) # number of excitatory cells   
+n_exc = int(round(n*r_ei/(1+r_ei)))   # number of excitatory cells
 n_inh = n - n_exc                     # number of inhibitory cells
 if benchmark == "COBA":
     celltype = IF_cond_exp
@@ -103,11 +101,17 @@ if simulator_name == "neuroml":
 node_id = setup(timestep=dt, min_delay=delay, max_delay=delay, **extra)
 np = num_processes()
 
+# Small function to display information only on node 1
+def nprint(s):
+    if node_id == 0:
+        print(s)
+
 host_name = socket.gethostname()
 print("Host #%d is on %s" % (node_id+1, host_name))
 
-print("%s Initialising the simulator with %d thread(s)..." % (node_id, extra['threads']))
-    
+nprint("Initialising the simulator with %d thread(s)..." % extra['threads'])
+
+
 cell_params = {
     'tau_m'      : tau_m,    'tau_syn_E'  : tau_exc,  'tau_syn_I'  : tau_inh,
     'v_rest'     : E_leak,   'v_reset'    : v_reset,  'v_thresh'   : v_thresh,
@@ -119,7 +123,7 @@ if (benchmark == "COBA"):
     
 timer.start()
 
-print("%s Creating cell populations..." % node_id)
+nprint("Creating cell populations...")
 exc_cells = Population((n_exc,), celltype, cell_params, "Excitatory_Cells")
 inh_cells = Population((n_inh,), celltype, cell_params, "Inhibitory_Cells")
 if benchmark == "COBA":
@@ -127,13 +131,13 @@ if benchmark == "COBA":
     rconn = 0.01
     ext_conn = FixedProbabilityConnector(rconn, weights=0.1)
 
-print("%s Initialising membrane potential to random values..." % node_id)
+nprint("Initialising membrane potential to random values...")
 rng = NumpyRNG(seed=rngseed, parallel_safe=parallel_safe, rank=node_id, num_processes=np)
 uniformDistr = RandomDistribution('uniform', [v_reset,v_thresh], rng=rng)
 exc_cells.randomInit(uniformDistr)
 inh_cells.randomInit(uniformDistr)
 
-print("%s Connecting populations..." % node_id)
+nprint("Connecting populations...")
 exc_conn = FixedProbabilityConnector(pconn, weights=w_exc, delays=delay)
 inh_conn = FixedProbabilityConnector(pconn, weights=w_inh, delays=delay)
 
@@ -147,10 +151,10 @@ if (benchmark == "COBA"):
     connections['ext2i'] = Projection(ext_stim, inh_cells, ext_conn, target='excitatory')
 
 # === Setup recording ==========================================================
-print("%s Setting up recording..." % node_id)
+nprint("Setting up recording...")
 exc_cells.record()
 inh_cells.record()
-vrecord_list = [exc_cells[0],exc_cells[1]]
+vrecord_list = exc_cells.index([0, 1])  # a single vectorized lookup, rather than one __getitem__ call per cell
 exc_cells.record_v(vrecord_list)
 
 buildCPUTime = timer.diff()
@@ -158,11 +162,11 @@ buildCPUTime = timer.diff()
 # === Save connections to file =================================================
 
 for prj in list(connections.keys()):
-    connections[prj].saveConnections('Results/VAbenchmark_%s_%s_%s_np%d.conn' % (benchmark, prj, simulator_name, np))
+    connections[prj].saveConnectionsBinary('Results/VAbenchmark_%s_%s_%s_np%d.conn.npz' % (benchmark, prj, simulator_name, np))
 saveCPUTime = timer.diff()
 
 # === Run simulation ===========================================================
-print("%d Running simulation..." % node_id)
+nprint("Running simulation...")
 
 run(tstop)
 
@@ -173,7 +177,7 @@ I_count = inh_cells.meanSpikeCount()
 
 # === Print results to file ====================================================
 
-print("%d Writing data to file..." % node_id)
+nprint("Writing data to file...")
 
 if not(os.path.isdir('Results')):
     os.mkdir('Results')
@@ -13,11 +13,10 @@ $Id$
 from __future__ import division
 from __future__ import print_function
 
-from past.utils import old_div
-from pyNN.utility import get_script_args, Timer
+from pyNN.utility import get_script_args, import_simulator, Timer
 
-simulator_name = get_script_args(1)[0]  
-exec("from pyNN.%s import *" % simulator_name)
+simulator_name = get_script_args(1)[0]
+import_simulator(simulator_name, globals())
 
 from pyNN.random import NumpyRNG, RandomDistribution
 
@@ -62,7 +61,7 @@ kernelseed  = 43210987
 # === Calculate derived parameters =============================================
 
 # scaling: compute effective order and synaptic strength
-order_eff = int(float(order)/downscale)
+order_eff = int(order/downscale)
 J_eff     = J*downscale
   
 # compute neuron numbers
@@ -81,13 +80,13 @@ Cext = CE               # number of external synapses on neuron
 fudge = 0.00041363506632638 # ensures dV = J at V=0  
   
 # excitatory weight: JE = J_eff / tauSyn * fudge
-JE = (old_div(J_eff,tauSyn))*fudge 
+JE = (J_eff/tauSyn)*fudge
   
 # inhibitory weight: JI = - g * JE
 JI = -g*JE  
   
 # threshold, external, and Poisson generator rates:
-nu_thresh = old_div(theta,(J_eff*CE*tauMem))
+nu_thresh = theta/(J_eff*CE*tauMem)
 nu_ext    = eta*nu_thresh     # external rate per synapse
 p_rate    = 1000*nu_ext*Cext  # external input rate per neuron (Hz)
                                     
@@ -114,70 +113,71 @@ extra = {}
 
 rank = setup(timestep=dt, max_delay=delay, **extra)
 np = num_processes()
+
+# Small function to display information only on node 1
+def nprint(s):
+    if (rank == 0):
+        print(s)
+
 import socket
 host_name = socket.gethostname()
 print("Host #%d is on %s" % (rank+1, host_name))
 
 if 'threads' in extra:
-    print("%d Initialising the simulator with %d threads..." %(rank, extra['threads']))
+    nprint("Initialising the simulator with %d threads..." % extra['threads'])
 else:
-    print("%d Initialising the simulator with single thread..." %(rank))
+    nprint("Initialising the simulator with single thread...")
 
-# Small function to display information only on node 1
-def nprint(s):
-    if (rank == 0):
-        print(s)
-
-timer.start() # start timer on construction    
+timer.start() # start timer on construction
 
-print("%d Setting up random number generator" %rank)
+nprint("Setting up random number generator")
 rng = NumpyRNG(kernelseed, parallel_safe=True, rank=rank, num_processes=np)
 
-print("%d Creating excitatory population with %d neurons." % (rank, NE))
+nprint("Creating excitatory population with %d neurons." % NE)
 E_net = Population((NE,),IF_curr_alpha,cell_params,"E_net")
 
-print("%d Creating inhibitory population with %d neurons." % (rank, NI))
+nprint("Creating inhibitory population with %d neurons." % NI)
 I_net = Population((NI,),IF_curr_alpha,cell_params,"I_net")
 
-print("%d Initialising membrane potential to random values between %g mV and %g mV." % (rank, U0, theta))
+nprint("Initialising membrane potential to random values between %g mV and %g mV." % (U0, theta))
 uniformDistr = RandomDistribution('uniform', [U0,theta], rng)
 E_net.randomInit(uniformDistr)
 I_net.randomInit(uniformDistr)
 
-print("%d Creating excitatory Poisson generator with rate %g spikes/s." % (rank, p_rate))
+nprint("Creating excitatory Poisson generator with rate %g spikes/s." % p_rate)
 expoisson = Population((NE,), SpikeSourcePoisson, {'rate': p_rate}, "expoisson")
 
-print("%d Creating inhibitory Poisson generator with the same rate." % rank)
+nprint("Creating inhibitory Poisson generator with the same rate.")
 inpoisson = Population((NI,), SpikeSourcePoisson, {'rate': p_rate}, "inpoisson")
 
 # Record spikes
-print("%d Setting up recording in excitatory population." % rank)
+nprint("Setting up recording in excitatory population.")
 E_net.record(Nrec)
-E_net.record_v([E_net[0],E_net[1]])
+E_net.record_v(E_net.index([0, 1]))
 
-print("%d Setting up recording in inhibitory population." % rank)
+nprint("Setting up recording in inhibitory population.")
 I_net.record(Nrec)
-I_net.record_v([I_net[0],I_net[1]])
+I_net.record_v(I_net.index([0, 1]))
 
 E_Connector = FixedProbabilityConnector(epsilon, weights=JE, delays=delay)
 I_Connector = FixedProbabilityConnector(epsilon, weights=JI, delays=delay)
 ext_Connector = OneToOneConnector(weights=JE, delays=dt)
 
-print("%d Connecting excitatory population with connection probability %g, weight %g nA and delay %g ms." % (rank, epsilon, JE, delay))
+nprint("Connecting excitatory population with connection probability %g, weight %g nA and delay %g ms." % (epsilon, JE, delay))
 E_to_E = Projection(E_net, E_net, E_Connector, rng=rng, target="excitatory")
-print("E --> E\t\t", len(E_to_E), "connections")
+nprint("E --> E\t\t %d connections" % len(E_to_E))
 I_to_E = Projection(I_net, E_net, I_Connector, rng=rng, target="inhibitory")
-print("I --> E\t\t", len(I_to_E), "connections")
+nprint("I --> E\t\t %d connections" % len(I_to_E))
 input_to_E = Projection(expoisson, E_net, ext_Connector, target="excitatory")
-print("input --> E\t", len(input_to_E), "connections")
+nprint("input --> E\t %d connections" % len(input_to_E))
 
-print("%d Connecting inhibitory population with connection probability %g, weight %g nA and delay %g ms." % (rank, epsilon, JI, delay))
+nprint("Connecting inhibitory population with connection probability %g, weight %g nA and delay %g ms." % (epsilon, JI, delay))
 E_to_I = Projection(E_net, I_net, E_Connector, rng=rng, target="excitatory")
-print("E --> I\t\t", len(E_to_I), "connections")
+nprint("E --> I\t\t %d connections" % len(E_to_I))
 I_to_I = Projection(I_net, I_net, I_Connector, rng=rng, target="inhibitory")
-print("I --> I\t\t", len(I_to_I), "connections")
+nprint("I --> I\t\t %d connections" % len(I_to_I))
 input_to_I = Projection(inpoisson, I_net, ext_Connector, target="excitatory")
-print("input --> I\t", len(input_to_I), "connections")
+nprint("input --> I\t %d connections" % len(input_to_I))
 
 # read out time used for building
 buildCPUTime = timer.elapsedTime()
@@ -185,21 +185,32 @@ buildCPUTime = timer.elapsedTime()
 
 # run, measure computer time
 timer.start() # start timer on construction
-print("%d Running simulation for %g ms." % (rank, simtime))
+nprint("Running simulation for %g ms." % simtime)
 run(simtime)
 simCPUTime = timer.elapsedTime()
 
-print("%d Writing data to file." % rank)
+nprint("Writing data to file.")
 exfilename  = "Results/Brunel_exc_np%d_%s.ras" % (np, simulator_name) # output file for excit. population  
 infilename  = "Results/Brunel_inh_np%d_%s.ras" % (np, simulator_name) # output file for inhib. population  
 vexfilename = "Results/Brunel_exc_np%d_%s.v"   % (np, simulator_name) # output file for membrane potential traces
 vinfilename = "Results/Brunel_inh_np%d_%s.v"   % (np, simulator_name) # output file for membrane potential traces
 
-# write data to file
-E_net.printSpikes(exfilename)
-I_net.printSpikes(infilename)
-E_net.print_v(vexfilename)
-I_net.print_v(vinfilename)
+# write data to file. The four writes are independent and I/O-bound, so when
+# running serially we overlap them with a thread pool; when running
+# distributed they must stay sequential, since each involves an MPI gather.
+writes = [(E_net.printSpikes, exfilename),
+          (I_net.printSpikes, infilename),
+          (E_net.print_v, vexfilename),
+          (I_net.print_v, vinfilename)]
+if np == 1:
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=len(writes)) as executor:
+        futures = [executor.submit(write, filename) for write, filename in writes]
+    for future in futures: # re-raise any exception from the worker threads
+        future.result()
+else:
+    for write, filename in writes:
+        write(filename)
 
 E_rate = E_net.meanSpikeCount()*1000.0/simtime
 I_rate = I_net.meanSpikeCount()*1000.0/simtime
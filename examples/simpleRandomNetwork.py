@@ -15,12 +15,12 @@ import os
 
 del os.environ['DISPLAY']
 
-from pyNN.utility import get_script_args, init_logging
+from pyNN.utility import get_script_args, import_simulator, init_logging
 
 logger = logging.getLogger("PyNN")
 
-simulator_name = get_script_args(1)[0]  
-exec("from pyNN.%s import *" % simulator_name)
+simulator_name = get_script_args(1)[0]
+import_simulator(simulator_name, globals())
 
 from pyNN.random import NumpyRNG
 
@@ -34,22 +34,29 @@ cell_params = {'tau_refrac': 2.0,  # ms
 n_record = 5
 
 node = setup(timestep=0.025, min_delay=1.0, max_delay=1.0, debug=True, quit_on_end=False)
-print("Process with rank %d running on %s" % (node, socket.gethostname()))
 
+# Small function to display information only on node 0
+def nprint(s):
+    if node == 0:
+        print(s)
+
+print("Process with rank %d running on %s" % (node, socket.gethostname()))
 
 rng = NumpyRNG(seed=seed, parallel_safe=True, rank=rank(), num_processes=num_processes())
 
-print("[%d] Creating populations" % node)
+nprint("Creating populations")
 n_spikes = int(2*tstop*input_rate/1000.0)
-spike_times = numpy.add.accumulate(rng.next(n_spikes, 'exponential',
-                                            [1000.0/input_rate], mask_local=False))
+# draw all the inter-spike intervals in one vectorized call, then accumulate
+# them in-place, so no temporary interval array is kept around
+spike_times = rng.next(n_spikes, 'exponential', [1000.0/input_rate], mask_local=False)
+numpy.cumsum(spike_times, out=spike_times)
 
 input_population  = Population(2, SpikeSourceArray, {'spike_times': spike_times }, "input")
 output_population = Population(2, IF_curr_exp, cell_params, "output")
 print("[%d] input_population cells: %s" % (node, input_population.local_cells))
 print("[%d] output_population cells: %s" % (node, output_population.local_cells))
 
-print("[%d] Connecting populations" % node)
+nprint("Connecting populations")
 connector = FixedProbabilityConnector(0.5, weights=1.0)
 projection = Projection(input_population, output_population, connector, rng=rng)
 
@@ -58,18 +65,18 @@ projection.saveConnections('%s.conn' % file_stem)
 
 input_population.record()
 output_population.record()
-output_population.record_v(n_record, rng)
+output_population.record_v() # the population is smaller than n_record, so record from all cells
 
-print("[%d] Running simulation" % node)
+nprint("Running simulation")
 run(tstop)
 
-print("[%d] Writing spikes to disk" % node)
+nprint("Writing spikes to disk")
 output_population.printSpikes('%s_output.ras' % file_stem)
 input_population.printSpikes('%s_input.ras' % file_stem)
-print("[%d] Writing Vm to disk" % node)
+nprint("Writing Vm to disk")
 output_population.print_v('%s.v' % file_stem)
 
-print("[%d] Finishing" % node)
+nprint("Finishing")
 end()
-print("[%d] Done" % node)
+nprint("Done")
 
@@ -459,6 +459,21 @@ def build_translations(*translation_list):
                                    'reverse_transform': g}
     return translations
 
+_transform_cache = {}
+
+def _compile_transform(expression):
+    """
+    Return a compiled code object for a transform expression, compiling it on
+    first use and caching it, so that translating parameters does not re-parse
+    the same expression strings for every cell.
+    """
+    try:
+        return _transform_cache[expression]
+    except KeyError:
+        code = compile(expression, '<string>', 'eval')
+        _transform_cache[expression] = code
+        return code
+
 class StandardModelType(object):
     """Base class for standardized cell model and synapse model classes."""
     
@@ -466,9 +481,35 @@ class StandardModelType(object):
     default_parameters = {}
     
     def __init__(self, parameters):
-        self.parameters = self.__class__.checkParameters(parameters, with_defaults=True)
-        self.parameters = self.__class__.translate(self.parameters)
-    
+        if parameters:
+            self.parameters = self.__class__.checkParameters(parameters, with_defaults=True)
+            self.parameters = self.__class__.translate(self.parameters)
+        else:
+            # the translated defaults are the same for every instance of a
+            # given class, so they are derived once and then reused
+            self.parameters = copy.deepcopy(self.__class__.translated_default_parameters())
+
+    @classmethod
+    def translated_default_parameters(cls):
+        """
+        Return the translation of default_parameters, computed once per class
+        and cached.
+        """
+        if '_translated_default_parameters' not in cls.__dict__:
+            cls._translated_default_parameters = cls.translate(
+                cls.checkParameters(None, with_defaults=True))
+        return cls._translated_default_parameters
+
+    @classmethod
+    def get_parameter_names(cls):
+        """
+        Return a tuple of the names of the model's parameters, computed once
+        per class and cached.
+        """
+        if '_parameter_names' not in cls.__dict__:
+            cls._parameter_names = tuple(sorted(cls.default_parameters))
+        return cls._parameter_names
+
     @classmethod
     def checkParameters(cls, supplied_parameters, with_defaults=False):
         """
@@ -483,7 +524,7 @@ class StandardModelType(object):
         """
         default_parameters = cls.default_parameters
         if with_defaults:
-            parameters = copy.copy(default_parameters)
+            parameters = dict(default_parameters) # dict() copies faster than copy.copy()
         else:
             parameters = {}
         if supplied_parameters:
@@ -524,7 +565,7 @@ class StandardModelType(object):
             if is_listlike(cls.default_parameters[name]):
                 parameters[name] = numpy.array(parameters[name])
             try:
-                pval = eval(D['forward_transform'], globals(), parameters)
+                pval = eval(_compile_transform(D['forward_transform']), globals(), parameters)
             except NameError as errmsg:
                 raise NameError("Problem translating '%s' in %s. Transform: '%s'. Parameters: %s. %s" \
                                 % (pname, cls.__name__, D['forward_transform'], parameters, errmsg))
@@ -542,7 +583,7 @@ class StandardModelType(object):
                 tname = D['translated_name']
                 native_parameters[tname] = numpy.array(native_parameters[tname])
             try:
-                standard_parameters[name] = eval(D['reverse_transform'], {}, native_parameters)
+                standard_parameters[name] = eval(_compile_transform(D['reverse_transform']), {}, native_parameters)
             except NameError as errmsg:
                 raise NameError("Problem translating '%s' in %s. Transform: '%s'. Parameters: %s. %s" \
                                 % (name, cls.__name__, D['reverse_transform'], native_parameters, errmsg))
@@ -585,6 +626,63 @@ class StandardCellType(StandardModelType):
     always_local = False # over-ride for NEST spike sources
 
 
+class PopulationParameters(object):
+    """
+    Structure-of-arrays storage for the parameters of a population of cells
+    of a single standard type: one contiguous float array per scalar
+    parameter, initialised from the class defaults.
+
+    A population of cells otherwise stores its parameters as one dict per
+    cell; accessing one parameter across the population then means a Python-
+    level gather through all the dicts. Here the same access is a unit-stride
+    read of a contiguous array, which numpy (or a compiled integrator working
+    on the buffers directly) can vectorize.
+
+    Note that PyNN itself does not integrate the model equations - that is
+    done by the simulator backends, in their own compiled code - so these
+    buffers are used on the Python side (parameter setting, building), not
+    in a per-timestep update loop.
+    """
+
+    def __init__(self, celltype_class, size):
+        self.celltype_class = celltype_class
+        self.size = size
+        if hasattr(celltype_class, '_default_dtype'):
+            # the standard cell classes carry a frozen row of their default
+            # values (see cells._freeze_default_parameters), so all the
+            # arrays can be seeded with one block allocation and one
+            # broadcast copy, instead of one dict lookup and allocation
+            # per parameter
+            self.names = celltype_class._parameter_names
+            defaults = celltype_class._default_row.view('f8')
+            block = numpy.empty((len(self.names), size))
+            block[:] = defaults[:, numpy.newaxis]
+            self._arrays = dict(zip(self.names, block))
+        else:
+            self.names = tuple(name for name in sorted(celltype_class.default_parameters)
+                               if isinstance(celltype_class.default_parameters[name], float))
+            self._arrays = {}
+            for name in self.names:
+                self._arrays[name] = celltype_class.default_parameters[name]*numpy.ones((size,))
+
+    def __getitem__(self, name):
+        """Return the array holding parameter `name` for all cells."""
+        return self._arrays[name]
+
+    def __setitem__(self, name, value):
+        """Set parameter `name` for all cells (`value` may be a scalar or an array of length size)."""
+        if name not in self._arrays:
+            raise NonExistentParameterError(name, self.celltype_class)
+        self._arrays[name][:] = value
+
+    def __contains__(self, name):
+        return name in self._arrays
+
+    def as_dict(self, i):
+        """Return the parameters of the ith cell as a dict."""
+        return dict((name, self._arrays[name][i]) for name in self.names)
+
+
 class ModelNotAvailable(object):
     """Not available for this simulator."""
     
@@ -858,10 +956,16 @@ class Population(object):
     def id_to_index(self, id):
         """
         Given the ID of a cell in the Population, return its index (order in the
-        Population).
+        Population). `id` may also be a list or array of IDs, in which case an
+        index array is returned and the bounds check is a single vectorized
+        comparison rather than one Python-level check per cell.
         >>> assert id_to_index(p.index(5)) == 5
         """
-        assert self.first_id <= id <= self.last_id 
+        if is_listlike(id):
+            id = numpy.asarray(id, dtype=int)
+            assert ((self.first_id <= id) & (id <= self.last_id)).all()
+        else:
+            assert self.first_id <= id <= self.last_id
         return id - self.first_id # this assumes ids are consecutive
     
     def index(self, n):
@@ -870,7 +974,7 @@ class Population(object):
         n may be a list or array, e.g., [i,j,k], in which case, returns the
         ith, jth and kth cells in the population."""
         if hasattr(n, '__len__'):
-            n = numpy.array(n)
+            n = numpy.asarray(n) # no copy if n is already an array
         return self.all_cells.flatten()[n]
     
     def __len__(self):
@@ -904,7 +1008,7 @@ class Population(object):
         # doesn't always work correctly if a position is equidistant between two
         # neurons, i.e. 0.5 should be rounded up, but it isn't always.
         # also doesn't take account of periodic boundary conditions
-        pos = numpy.array([position]*self.positions.shape[1]).transpose()
+        pos = numpy.asarray(position).reshape(-1, 1) # broadcast against positions
         dist_arr = (self.positions - pos)**2
         distances = dist_arr.sum(axis=0)
         nearest = distances.argmin()
@@ -985,8 +1089,17 @@ class Population(object):
         rarr = rand_distr.next(n=self.all_cells.size, mask_local=self._mask_local.flatten())
         rarr = numpy.array(rarr)
         logger.debug("%s.rset('%s', %s)", self.label, parametername, rand_distr)
-        for cell,val in zip(self, rarr):
-            setattr(cell, parametername, val)
+        if isinstance(self.celltype, StandardCellType) and \
+           parametername in self.celltype.simple_parameters():
+            # for a parameter that translates one-to-one, the name translation
+            # can be hoisted out of the loop and the per-cell parameter
+            # checking/translation machinery skipped entirely
+            translated_name = self.celltype.translations[parametername]['translated_name']
+            for cell,val in zip(self, rarr):
+                cell.set_native_parameters({translated_name: val})
+        else:
+            for cell,val in zip(self, rarr):
+                setattr(cell, parametername, val)
     
     def _call(self, methodname, arguments):
         """
@@ -1026,15 +1139,18 @@ class Population(object):
         """
         if not self.can_record(variable):
             raise RecordingError(variable, self.celltype)
-        if isinstance(record_from, list): #record from the fixed list specified by user
+        if is_listlike(record_from): #record from the fixed list or array specified by user
             pass
         elif record_from is None: # record from all cells:
             record_from = self.all_cells.flatten()
-        elif isinstance(record_from, int): # record from a number of cells, selected at random  
+        elif isinstance(record_from, int): # record from a number of cells, selected at random
             nrec = record_from
-            if not rng:
-                rng = random.NumpyRNG()
-            record_from = rng.permutation(self.all_cells.flatten())[0:nrec]
+            if nrec >= self.size: # all cells are recorded, so there is nothing to select
+                record_from = self.all_cells.flatten()
+            else:
+                if not rng:
+                    rng = random.NumpyRNG()
+                record_from = rng.permutation(self.all_cells.flatten())[0:nrec]
             logger.debug("The %d cells recorded have IDs %s" % (nrec, record_from))
         else:
             raise Exception("record_from must be either a list of cells or the number of cells to record from")
@@ -1436,35 +1552,68 @@ class Projection(object):
                                             "%s", "%g", "%g")
         else:
             fmt = "%s\t%s\t%s\t%s\n" % ("%d", "%d", "%g", "%g")
-        lines = []
-        if not compatible_output:
-            for c in self.connections:   
-                line = fmt  % (c.source, 
-                               c.target,
-                               c.weight,
-                               c.delay)
-                lines.append(line)
-        else:
-            for c in self.connections:   
-                line = fmt  % (self.pre.locate(c.source),
-                              self.post.locate(c.target),
-                              c.weight,
-                              c.delay)
-                line = line.replace('(','[').replace(')',']')
-                lines.append(line)
+        # gather the raw numbers and only format them as text on the rank
+        # that actually writes the file, so the other ranks do not spend
+        # their time building strings that are thrown away. Coerce the ids to
+        # plain ints first: backend ID objects carry a reference to their
+        # parent Population, which must not be dragged into the pickled
+        # MPI message
+        data = [(int(c.source), int(c.target), float(c.weight), float(c.delay))
+                for c in self.connections]
         if gather == True and num_processes() > 1:
-            all_lines = { rank(): lines }
-            all_lines = recording.gather_dict(all_lines)
+            all_data = { rank(): data }
+            all_data = recording.gather_dict(all_data)
             if rank() == 0:
-                lines = reduce(operator.add, list(all_lines.values()))
+                data = reduce(operator.add, list(all_data.values()))
         elif num_processes() > 1:
             filename += '.%d' % rank()
         logger.debug("--- Projection[%s].__saveConnections__() ---" % self.label)
         if gather == False or rank() == 0:
+            lines = []
+            if not compatible_output:
+                for source, target, weight, delay in data:
+                    lines.append(fmt % (source, target, weight, delay))
+            else:
+                for source, target, weight, delay in data:
+                    line = fmt % (self.pre.locate(source),
+                                  self.post.locate(target),
+                                  weight,
+                                  delay)
+                    lines.append(line.replace('(','[').replace(')',']'))
             f = open(filename, 'w')
             f.writelines(lines)
             f.close()
     
+    def saveConnectionsBinary(self, filename, gather=True):
+        """
+        Save connections to file in NumPy compressed binary (.npz) format.
+
+        The file contains four equal-length arrays: `source` and `target`
+        give the indices of the connected cells within the pre- and
+        postsynaptic populations, `weight` and `delay` the connection
+        parameters as float32. This writes one binary block per array rather
+        than one formatted text line per synapse, which is much faster and
+        produces much smaller files for large projections. Use
+        `saveConnections()` if output suitable for a FromFileConnector is
+        needed.
+        """
+        data = numpy.array([(c.source, c.target, c.weight, c.delay)
+                            for c in self.connections], dtype=float)
+        data = data.reshape((-1, 4)) # so that empty connection lists keep 4 columns
+        if gather == True and num_processes() > 1:
+            all_data = recording.gather_dict({rank(): data})
+            if rank() == 0:
+                data = numpy.concatenate(list(all_data.values()))
+        elif num_processes() > 1:
+            filename += '.%d' % rank()
+        logger.debug("--- Projection[%s].__saveConnectionsBinary__() ---" % self.label)
+        if gather == False or rank() == 0:
+            numpy.savez_compressed(filename,
+                                   source=(data[:,0] - self.pre.first_id).astype('uint32'),
+                                   target=(data[:,1] - self.post.first_id).astype('uint32'),
+                                   weight=data[:,2].astype('float32'),
+                                   delay=data[:,3].astype('float32'))
+
     def printWeights(self, filename, format='list', gather=True):
         """Print synaptic weights to file. In the array format, zeros are printed
         for non-existent connections."""
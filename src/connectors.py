@@ -90,8 +90,102 @@ class Connector(object):
         return delays
 
     
+def index_dtype(n):
+    """
+    Return the smallest unsigned integer dtype able to index an array of
+    length n.
+    """
+    if n < 2**16:
+        return numpy.uint16
+    elif n < 2**32:
+        return numpy.uint32
+    else:
+        return numpy.uint64
+
+
+def geometric_sample(rng, p, n):
+    """
+    Return the sorted indices in [0, n) of the successes of n Bernoulli trials
+    with success probability p, obtained by drawing the geometrically-
+    distributed gaps between successive successes rather than one random number
+    per trial. Only ~p*n random numbers are drawn, but the connection
+    statistics are identical to the one-number-per-trial method.
+    """
+    expected = p*n
+    block = int(expected + 3*numpy.sqrt(expected)) + 2
+    positions = numpy.cumsum(rng.geometric(p, size=block)) - 1
+    while positions[-1] < n:
+        positions = numpy.concatenate((positions,
+                                       positions[-1] + numpy.cumsum(rng.geometric(p, size=block))))
+    return positions[positions < n]
+
+
 class ProbabilisticConnector(Connector):
-    
+
+    def _fast_connect_possible(self, projection, p):
+        """
+        The geometric-skip sampler can only be used where it keeps the
+        connection statistics identical to the dense Bernoulli draw: a scalar
+        probability strictly between 0 and 1, scalar weights and delays, and a
+        serial NumpyRNG with all postsynaptic cells local (in a distributed
+        simulation the dense draw is needed to keep the random streams
+        reproducible across nodes).
+        """
+        return (common.is_number(p) and 0.0 < p < 1.0
+                and isinstance(projection.rng, random.NumpyRNG)
+                and projection.rng.num_processes == 1
+                and projection.post.local_cells.size == projection.post.size
+                and common.is_number(self.weights)
+                and common.is_number(self.delays))
+
+    def _probabilistic_connect_fast(self, projection, p):
+        """
+        Connect-up a Projection with scalar connection probability p, drawing
+        the gaps between connected targets instead of one Bernoulli sample per
+        pre-post pair. This reduces the number of random draws (and hence the
+        build time for sparse connectivity, such as the benchmark networks) by
+        a factor of ~1/p.
+        """
+        rng = projection.rng
+        n_pre = projection.pre.size
+        n_post = projection.post.size
+        pre_cells = projection.pre.all_cells.flatten()
+        post_cells = projection.post.local_cells # all cells, since we are running serially
+        is_conductance = common.is_conductance(projection.post.index(0))
+        no_self = not self.allow_self_connections and projection.pre == projection.post
+        w = float(self.weights)
+        d = float(self.delays)
+        # sample the flattened pre x post space in vectorized passes over
+        # blocks of presynaptic rows, rather than looping over presynaptic
+        # cells in Python. Blocking keeps the temporary index arrays bounded
+        # (around a million connections at a time) however large the
+        # projection, which matters for full-scale benchmark networks. Since
+        # the Bernoulli trials are independent, restarting the geometric-gap
+        # sampler at each block boundary leaves the statistics unchanged.
+        rows_per_block = max(1, int(1e6/(p*n_post)))
+        for start in range(0, n_pre, rows_per_block):
+            stop = min(start + rows_per_block, n_pre)
+            positions = geometric_sample(rng, p, (stop - start)*n_post)
+            rows = positions//n_post + start
+            if no_self:
+                keep = rows != positions % n_post
+                positions = positions[keep]
+                rows = rows[keep]
+            # hold the connectivity in CSR form (indptr, indices), with the
+            # narrowest index type that can address the postsynaptic
+            # population, rather than one 64-bit entry per connection
+            indices = (positions % n_post).astype(index_dtype(n_post))
+            indptr = numpy.searchsorted(rows, numpy.arange(start, stop+1))
+            del positions, rows
+            for i in range(start, stop):
+                row = indices[indptr[i-start]:indptr[i-start+1]]
+                if len(row) > 0:
+                    targets = post_cells[row].tolist()
+                    weights = common.check_weight(w*numpy.ones((len(targets),)),
+                                                  projection.synapse_type, is_conductance)
+                    delays = d*numpy.ones((len(targets),))
+                    projection.connection_manager.connect(pre_cells[i], targets, weights, delays)
+
     def _probabilistic_connect(self, projection, p):
         """
         Connect-up a Projection with connection probability p, where p may be either
@@ -103,45 +197,83 @@ class ProbabilisticConnector(Connector):
             raise Exception("Use of NativeRNG not implemented.")
         else:
             rng = projection.rng
-        
+
+        if self._fast_connect_possible(projection, p):
+            return self._probabilistic_connect_fast(projection, p)
+
         local = projection.post._mask_local.flatten()
         is_conductance = common.is_conductance(projection.post.index(0))
-        for src in projection.pre.all():
-            # ( the following two lines are a nice idea, but this needs some thought for
-            #   the parallel case, to ensure reproducibility when varying the number
-            #   of processors
-            #      N = rng.binomial(npost,self.p_connect,1)[0]
-            #      targets = sample(postsynaptic_neurons, N)   # )
-            N = projection.post.size
+        N = projection.post.size
+        pre_cells = list(projection.pre.all())
+        # ( the following two lines are a nice idea, but this needs some thought for
+        #   the parallel case, to ensure reproducibility when varying the number
+        #   of processors
+        #      N = rng.binomial(npost,self.p_connect,1)[0]
+        #      targets = sample(postsynaptic_neurons, N)   # )
+        # the random numbers for many presynaptic cells are drawn in a single
+        # call, since per-call overhead dominates small draws. The generators
+        # consume one number per value whatever the draw size, so this leaves
+        # the connectivity stream identical to drawing row by row -- but only
+        # as long as nothing else draws from the same generator between rows.
+        # If the weights or delays are a RandomDistribution sharing the
+        # projection's RNG, their draws are interleaved with the connectivity
+        # draws, so fall back to one row per call to preserve the ordering.
+        if ((isinstance(self.weights, random.RandomDistribution) and self.weights.rng is rng) or
+            (isinstance(self.delays, random.RandomDistribution) and self.delays.rng is rng)):
+            rows_per_block = 1
+        else:
+            rows_per_block = max(1, int(1e6)//N)
+        for start in range(0, len(pre_cells), rows_per_block):
+            block = pre_cells[start:start+rows_per_block]
             # if running in parallel, rng.next(N) will not return N values, but only
             # as many as are needed on this node, as determined by mask_local.
             # Over the simulation as a whole (all nodes), N values will indeed be
             # returned.
-            rarr = rng.next(N, 'uniform', (0, 1), mask_local=local)
+            rarr = rng.next(N*len(block), 'uniform', (0, 1),
+                            mask_local=numpy.tile(local, len(block)))
             if not common.is_listlike(rarr) and common.is_number(rarr): # if N=1, rarr will be a single number
                 rarr = numpy.array([rarr])
-            if common.is_number(p):
-                create = rarr < p
-            else:
-                create = rarr < p[src][local]
-            if create.shape != projection.post.local_cells.shape:
-                logger.warning("Too many random numbers. Discarding the excess. Did you specify MPI rank and number of processes when you created the random number generator?")
-                create = create[:projection.post.local_cells.size]
-            targets = projection.post.local_cells[create].tolist()
-            
-            weights = self.get_weights(N, local)[create]
-            weights = common.check_weight(weights, projection.synapse_type, is_conductance)
-            delays  = self.get_delays(N, local)[create]
-            
-            if not self.allow_self_connections and projection.pre == projection.post and src in targets:
-                assert len(targets) == len(weights) == len(delays)
-                i = targets.index(src)
-                weights = numpy.delete(weights, i)
-                delays = numpy.delete(delays, i)
-                targets.remove(src)
-            
-            if len(targets) > 0:
-                projection.connection_manager.connect(src, targets, weights, delays)
+            rarr = rarr.reshape((len(block), -1))
+            for j, src in enumerate(block):
+                self._connect_row(projection, src, rarr[j], p, local, is_conductance)
+
+    def _connect_row(self, projection, src, rarr, p, local, is_conductance):
+        """
+        Connect-up a single presynaptic cell, given the uniform random numbers
+        drawn for its row of the connection matrix.
+        """
+        if common.is_number(p):
+            create = rarr < p
+        else:
+            create = rarr < p[src][local]
+        if create.shape != projection.post.local_cells.shape:
+            logger.warning("Too many random numbers. Discarding the excess. Did you specify MPI rank and number of processes when you created the random number generator?")
+            create = create[:projection.post.local_cells.size]
+        targets = projection.post.local_cells[create].tolist()
+        n_conn = len(targets)
+
+        # for scalar weights/delays, allocate arrays of just the right
+        # size, rather than one value per postsynaptic cell followed by
+        # masking
+        if common.is_number(self.weights):
+            weights = float(self.weights)*numpy.ones((n_conn,))
+        else:
+            weights = self.get_weights(projection.post.size, local)[create]
+        weights = common.check_weight(weights, projection.synapse_type, is_conductance)
+        if common.is_number(self.delays):
+            delays = float(self.delays)*numpy.ones((n_conn,))
+        else:
+            delays  = self.get_delays(projection.post.size, local)[create]
+
+        if not self.allow_self_connections and projection.pre == projection.post and src in targets:
+            assert len(targets) == len(weights) == len(delays)
+            i = targets.index(src)
+            weights = numpy.delete(weights, i)
+            delays = numpy.delete(delays, i)
+            targets.remove(src)
+
+        if len(targets) > 0:
+            projection.connection_manager.connect(src, targets, weights, delays)
 
 
 class AllToAllConnector(ProbabilisticConnector):
@@ -316,8 +448,13 @@ class FixedNumberPostConnector(Connector):
                 targets += [candidates[candidates.index(id)] for id in projection.rng.permutation(candidates)[0:n]]
                 # have to use index() because rng.permutation returns ints, not ID objects
             
-            targets = numpy.array(targets[:n], dtype=common.IDMixin)
-            
+            targets = targets[:n]
+            # connect in ascending id order: the simulator fills in its
+            # connection structures contiguously, and the weight/delay values
+            # are only permuted, which leaves their statistics unchanged
+            targets.sort()
+            targets = numpy.array(targets, dtype=common.IDMixin)
+
             weights = self.get_weights(n)
             is_conductance = common.is_conductance(projection.post.index(0))
             weights = common.check_weight(weights, projection.synapse_type, is_conductance)
@@ -398,7 +535,9 @@ class FixedNumberPreConnector(Connector):
                 sources += [candidates[candidates.index(id)] for id in projection.rng.permutation(candidates)[0:n]]
                 # have to use index() because rng.permutation returns ints, not ID objects
             sources = sources[:n]
-            
+            # connect in ascending id order (see FixedNumberPostConnector)
+            sources.sort()
+
             weights = self.get_weights(n)
             is_conductance = common.is_conductance(projection.post.index(0))
             weights = common.check_weight(weights, projection.synapse_type, is_conductance)
@@ -441,12 +580,14 @@ class OneToOneConnector(Connector):
             is_conductance = common.is_conductance(projection.post.index(0))
             weights = common.check_weight(weights, projection.synapse_type, is_conductance)
             delays = self.get_delays(N, local)
-            
-            for tgt, w, d in zip(projection.post.local_cells,
-                                 weights,
-                                 delays):
-                src = projection.pre.index(projection.post.id_to_index(tgt))
-                
+
+            # since the mapping is the identity, all the source cells can be
+            # looked up with a single fancy-indexing operation, instead of
+            # calling index()/id_to_index() once per connection
+            post_cells = projection.post.local_cells
+            indices = numpy.asarray(post_cells, dtype=int) - projection.post.first_id
+            sources = projection.pre.all_cells.flatten()[indices]
+            for src, tgt, w, d in zip(sources, post_cells, weights, delays):
                 # the float is in case the values are of type numpy.float64, which NEST chokes on
                 projection.connection_manager.connect(src, [tgt], float(w), float(d))
         else:
@@ -524,7 +665,6 @@ class DistanceDependentProbabilityConnector(ProbabilisticConnector):
         except ZeroDivisionError as err:
             raise ZeroDivisionError("Error in the distance expression %s. %s" % (d_expression, err))
         self.d_expression = d_expression
-        self.space = space
         assert isinstance(allow_self_connections, bool)
         self.allow_self_connections = allow_self_connections
         assert isinstance(space, common.Space)
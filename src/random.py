@@ -71,7 +71,7 @@ class WrappedRNG(AbstractRNG):
         If n >= 0, return a numpy array,
         if n < 0, raise an Exception."""
         if n == 0:
-            rarr = numpy.random.rand(0) # We return an empty array
+            rarr = numpy.empty(0) # We return an empty array
         elif n > 0:
             if self.num_processes > 1 and not self.parallel_safe:
                 # n is the number for the whole model, so if we do not care about
@@ -96,7 +96,7 @@ class WrappedRNG(AbstractRNG):
                 # This assumes that the first neuron in a population is always created on
                 # the node with rank 0, and that neurons are distributed in a round-robin
                 # This assumption is not true for NEST
-                rarr = rarr[numpy.arange(self.rank, len(rarr), self.num_processes)]
+                rarr = rarr[self.rank::self.num_processes] # a view, so no index array or copy is made
         if hasattr(rarr, '__len__') and len(rarr) == 1:
             return rarr[0]
         else:
@@ -152,6 +152,20 @@ class GSLRNG(WrappedRNG):
 
 # should add a wrapper for the built-in Python random module.
 
+_default_rng = None
+
+def _get_default_rng():
+    """
+    Return the NumpyRNG shared by all RandomDistributions created without an
+    explicit rng. It is created on first use, so that the (relatively
+    expensive) RandomState initialisation is not repeated for every
+    distribution object.
+    """
+    global _default_rng
+    if _default_rng is None:
+        _default_rng = NumpyRNG()
+    return _default_rng
+
 
 class NativeRNG(AbstractRNG):
     """
@@ -200,8 +214,8 @@ class RandomDistribution(object):
         if rng:
             assert isinstance(rng, AbstractRNG), "rng must be a pyNN.random RNG object"
             self.rng = rng
-        else: # use numpy.random.RandomState() by default
-            self.rng = NumpyRNG()
+        else: # use a shared numpy.random.RandomState() by default
+            self.rng = _get_default_rng()
         
     def next(self, n=1, mask_local=None):
         """Return n random numbers from the distribution."""
@@ -94,9 +94,13 @@ class StandardTextFile(BaseFile):
         # write header
         header_lines = ["# %s = %s" % item for item in list(metadata.items())]
         self.fileobj.write("\n".join(header_lines) + '\n')
-        # write data
-        savetxt = getattr(numpy, 'savetxt', _savetxt)
-        savetxt(self.fileobj, data, fmt='%s', delimiter='\t')
+        # write data, formatting a whole row at a time and writing the result
+        # in a single call, which is considerably faster than formatting
+        # element by element via str()
+        if data.size > 0:
+            data = numpy.atleast_2d(data)
+            fmt = '\t'.join(['%s']*data.shape[1]) # %s keeps full precision
+            self.fileobj.write('\n'.join([fmt % tuple(row) for row in data]) + '\n')
         self.fileobj.close()
 
 
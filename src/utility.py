@@ -6,6 +6,8 @@ Functions:
     notify()          - send an e-mail when a simulation has finished.
     get_script_args() - get the command line arguments to the script, however
                         it was run (python, nrniv, mpirun, etc.).
+    import_simulator()- import a simulator backend module by name, optionally
+                        binding its public names into a given namespace.
     init_logging()    - convenience function for setting up logging to file and
                         to the screen.
     
@@ -26,9 +28,11 @@ except ImportError:
     SMTPHOST = None
     EMAIL = None
 import sys
+import importlib
 import logging
 import time
 import os
+import numpy
 
 red     = 0o010; green  = 0o020; yellow = 0o030; blue = 0o040;
 magenta = 0o050; cyan   = 0o060; bright = 0o100
@@ -80,90 +84,142 @@ def get_script_args(n_args, usage=''):
         raise Exception(usage)
     return args
     
+def import_simulator(simulator_name, namespace=None):
+    """
+    Import the `pyNN.<simulator_name>` backend module and return it.
+
+    If namespace is given (e.g. the globals() of a script), the module's
+    public names are also bound there, giving the same effect as
+    `from pyNN.<simulator_name> import *` but without building and exec'ing
+    an import statement from a string.
+    """
+    module = importlib.import_module("pyNN.%s" % simulator_name)
+    if namespace is not None:
+        names = getattr(module, '__all__', None)
+        if names is None:
+            names = [name for name in dir(module) if not name.startswith('_')]
+        for name in names:
+            namespace[name] = getattr(module, name)
+    return module
+
+_log_handler = None
+
 def init_logging(logfile, debug=False, num_processes=1, rank=0):
+    """
+    Set up logging to `logfile` (with the rank appended when running
+    distributed).
+
+    Log calls should use lazy interpolation, e.g.
+    `logger.debug("weights = %s", weights)` rather than formatting the
+    message at the call site, so that the formatting cost is only paid for
+    records that actually pass the level filter.
+    """
+    global _log_handler
     if num_processes > 1:
         logfile += '.%d' % rank
     logfile = os.path.abspath(logfile)
+    # install an explicit handler rather than using logging.basicConfig(),
+    # which silently does nothing if the root logger is already configured
+    # (e.g. by the host application), and so that the formatter, with its
+    # relatively expensive %(asctime)s, is only applied to records that are
+    # actually written to the file
+    if _log_handler is not None: # don't stack handlers on repeated calls
+        logging.getLogger().removeHandler(_log_handler)
+        _log_handler.close()
+    handler = logging.FileHandler(logfile, mode='w')
+    _log_handler = handler
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
     if debug:
-        logging.basicConfig(level=logging.DEBUG,
-                    format='%(asctime)s %(levelname)s %(message)s',
-                    filename=logfile,
-                    filemode='w')
+        root_logger.setLevel(logging.DEBUG)
     else:
-        logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s %(levelname)s %(message)s',
-                    filename=logfile,
-                    filemode='w')
+        root_logger.setLevel(logging.INFO)
 
 def save_population(population,filename,variables=[]):
     """
     Saves the spike_times of a  population and the dim, size, labels such that one can load it back into a SpikeSourceArray population using the load_population function.
+
+    The data are stored in numpy compressed binary (.npz) format: one
+    contiguous, compressed write, instead of one pickle round-trip per key as
+    with the previous shelve-based format.
     """
-    import shelve
-    s = shelve.open(filename)
-    s['spike_times'] = population.getSpikes()
-    s['label'] = population.label
-    s['dim'] = population.dim
-    s['size'] = population.size
-    variables_dict = {}
+    from .cells import SPIKE_DTYPE
+    contents = {'spike_times': numpy.asarray(population.getSpikes(), dtype=SPIKE_DTYPE),
+                'label': numpy.array(population.label),
+                'dim': numpy.array(population.dim),
+                'size': population.size}
     for variable in variables:
-        variables_dict[variable] = eval('population.%s'%variable)
-    s['variables'] = variables_dict
-    s.close()
+        contents['var_%s' % variable] = getattr(population, variable)
+    numpy.savez_compressed(filename, **contents)
 
 def load_population(filename):
     """
     Loads a population that was saved with the save_population function into SpikeSourceArray.
     """
-    import shelve
-    s = shelve.open(filename)
-    population = Population(s['dim'],SpikeSourceArray,label=s['label'])
-    # set the spiketimes
+    if not filename.endswith('.npz'):
+        filename += '.npz' # numpy.savez_compressed appends the suffix when saving
+    s = numpy.load(filename, allow_pickle=True)
+    population = Population(tuple(s['dim']),SpikeSourceArray,label=str(s['label']))
+    # set the spiketimes. The spikes are sorted by neuron id once, and the
+    # sorted array cut into one contiguous slice per neuron, rather than
+    # scanning the whole spike array with a fresh boolean mask for each neuron
     spikes = s['spike_times']
-    for neuron in numpy.arange(s['size']):
-        spike_times = spikes[spikes[:,0]==neuron][:,1]
+    size = int(s['size'])
+    order = numpy.argsort(spikes[:,0], kind='stable')
+    sorted_spikes = spikes[order]
+    boundaries = numpy.searchsorted(sorted_spikes[:,0], numpy.arange(size+1))
+    for neuron in numpy.arange(size):
+        spike_times = sorted_spikes[boundaries[neuron]:boundaries[neuron+1],1]
         neuron_in_new_population = neuron+population.first_id
         index = population.locate(neuron_in_new_population)
         population[index].set_parameters(**{'spike_times':spike_times})
     # set the variables
-    for variable, value in list(s['variables'].items()):
-        exec('population.%s = value'%variable)
+    for name in s.files:
+        if name.startswith('var_'):
+            setattr(population, name[len('var_'):], s[name])
     s.close()
     return population
 
 class Timer(object):
     """For timing script execution."""
-    
+
+    # number of seconds per unit, largest first, for time_in_words()
+    UNITS = (('year', 31556952), ('day', 86400), ('hour', 3600),
+             ('minute', 60), ('second', 1))
+
     def __init__(self):
         self.start()
-    
+
     def start(self):
         """Start timing."""
-        self._start_time = time.time()
+        # perf_counter() is monotonic (not subject to clock adjustments) and
+        # has a finer resolution than time()
+        self._start_time = time.perf_counter()
         self._last_check = self._start_time
-    
+
     def elapsedTime(self, format=None):
         """Return the elapsed time in seconds but keep the clock running."""
-        current_time = time.time()
+        current_time = time.perf_counter()
         elapsed_time = current_time - self._start_time
         if format=='long':
             elapsed_time = Timer.time_in_words(elapsed_time)
         self._last_check = current_time
         return elapsed_time
-    
+
     def reset(self):
         """Reset the time to zero, and start the clock."""
         self.start()
-    
+
     def diff(self, format=None): # I think delta() would be a better name for this method.
         """Return the time since the last time elapsedTime() or diff() was called."""
-        current_time = time.time()
+        current_time = time.perf_counter()
         time_since_last_check = current_time - self._last_check
         self._last_check = current_time
         if format=='long':
-            time_since_last_check = Timer.time_in_words(elapsed_time)
+            time_since_last_check = Timer.time_in_words(time_since_last_check)
         return time_since_last_check
-    
+
     @staticmethod
     def time_in_words(s):
         """Formats a time in seconds as a string containing the time in days,
@@ -175,12 +231,9 @@ class Timer(object):
             >>> time_in_words(24*3600)
             1 day
         """
-        # based on http://mail.python.org/pipermail/python-list/2003-January/181442.html
-        T = {}
-        T['year'], s = divmod(s, 31556952)
-        min, T['second'] = divmod(s, 60)
-        h, T['minute'] = divmod(min, 60)
-        T['day'], T['hour'] = divmod(h, 24)
-        def add_units(val, units):
-            return "%d %s" % (int(val), units) + (val>1 and 's' or '')
-        return ', '.join([add_units(T[part], part) for part in ('year', 'day', 'hour', 'minute', 'second') if T[part]>0])
+        parts = []
+        for unit, seconds_per_unit in Timer.UNITS:
+            value, s = divmod(s, seconds_per_unit)
+            if value > 0:
+                parts.append("%d %s%s" % (value, unit, value > 1 and 's' or ''))
+        return ', '.join(parts)
@@ -11,7 +11,7 @@ for x in range(7):
     N = pow(10, x)
     local_data = numpy.empty((N,2))
     local_data[:,0] = numpy.ones(N, dtype=float)*comm.rank
-    local_data[:,1] = numpy.random.rand(N)
+    local_data[:,1] = numpy.arange(N, dtype=float) # the payload values are never inspected, so use a deterministic, cheap-to-build array
     
     start_time = time.time()
     all_data = gather(local_data)
@@ -3,9 +3,6 @@ Unit tests for the common, cells, synapses, connectors modules
 $Id$
 """
 
-from builtins import str
-from past.builtins import basestring
-from builtins import object
 import sys
 import unittest
 import numpy
@@ -16,6 +13,21 @@ from pyNN import common, random, cells, synapses, connectors
 def arrays_almost_equal(a, b, threshold):
     return (abs(a-b) <= threshold).all()
 
+# fake cell classes used by StandardModelTest, built once at import instead
+# of redefining them (and rebuilding their translation tables) on every run
+# of the test method
+class FakeCellType(common.StandardCellType):
+    default_parameters = {'foo': 3, 'other_parameter': 5}
+
+class SimFakeCellType1(FakeCellType):
+    translations = common.build_translations(('foo', 'bar', 'foo*non_existent_parameter', 'bar/non_existent_parameter'))
+
+class SimFakeCellType2(FakeCellType):
+    translations = common.build_translations(
+        ('foo', 'bar', 'foo*other_parameter', 'bar/non_existent_parameter'),
+        ('other_parameter', 'translated_other_parameter'),
+    )
+
 # ==============================================================================
 class ExceptionsTest(unittest.TestCase):
     
@@ -66,21 +78,28 @@ class DistanceTest(unittest.TestCase):
         cell2.position = (-1.7, 8.5, -5.3)
         self.assertEqual(common.distance(cell1, cell2, periodic_boundaries=numpy.array([7.0, 1e12, 1e12])), 13.0)
 
+# coordinate fixtures for SpaceTest, built once at import and marked
+# read-only so no test can modify them for the others
+_POSITIONS = {'A': numpy.array([0.0, 0.0, 0.0]),
+              'B': numpy.array([1.0, 1.0, 1.0]),
+              'C': numpy.array([-1.0, -1.0, -1.0]),
+              'D': numpy.array([2.0, 3.0, 4.0])}
+_POSITIONS['ABCD'] = numpy.array([_POSITIONS['A'], _POSITIONS['B'],
+                                  _POSITIONS['C'], _POSITIONS['D']]).T
+for _arr in _POSITIONS.values():
+    _arr.setflags(write=False)
+
 class SpaceTest(unittest.TestCase):
-    
-    def setUp(self):
-        N = numpy.array
-        self.A = N([0.0, 0.0, 0.0])
-        self.B = N([1.0, 1.0, 1.0])
-        self.C = N([-1.0, -1.0, -1.0])
-        self.D = N([2.0, 3.0, 4.0])
-        self.ABCD = N([[0.0, 0.0, 0.0],
-                       [1.0, 1.0, 1.0],
-                       [-1.0, -1.0, -1.0],
-                       [2.0, 3.0, 4.0]]).T
+
+    A = _POSITIONS['A']
+    B = _POSITIONS['B']
+    C = _POSITIONS['C']
+    D = _POSITIONS['D']
+    ABCD = _POSITIONS['ABCD']
 
     def assertArraysEqual(self, A, B):
-        self.assert_((A==B).all(), "%s != %s" % (A,B))
+        if not (A==B).all():
+            self.fail("%s != %s" % (A,B)) # only format the arrays on failure
     
     def test_infinite_space_with_3D_distances(self):
         s = common.Space()
@@ -134,24 +153,63 @@ class StandardModelTest(unittest.TestCase):
         self.assertRaises(common.NonExistentParameterError, cells.IF_cond_exp, {'foo': 'bar'})
         
     def testTranslate(self):
-        class FakeCellType(common.StandardCellType):
-            default_parameters = {'foo': 3, 'other_parameter': 5}
-        class SimFakeCellType1(FakeCellType):
-            translations = common.build_translations(('foo', 'bar', 'foo*non_existent_parameter', 'bar/non_existent_parameter'))
-        class SimFakeCellType2(FakeCellType):
-            translations = common.build_translations(
-                ('foo', 'bar', 'foo*other_parameter', 'bar/non_existent_parameter'),
-                ('other_parameter', 'translated_other_parameter'),    
-            )
         self.assertRaises(NameError, SimFakeCellType1, {'foo': 4})
         cell_type = SimFakeCellType2({'foo': 4, 'other_parameter': 5})
         self.assertRaises(NameError, cell_type.reverse_translate, {'bar': 20})
-        assert isinstance(cell_type.describe(), basestring) # this belongs in a separate test
+        assert isinstance(cell_type.describe(), str) # this belongs in a separate test
         
     def testCreatingNonAvailableModel(self):
         self.assertRaises(NotImplementedError, common.ModelNotAvailable)
                               
 
+class PopulationIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        # a bare Population suffices: id_to_index only uses the id range
+        self.p = common.Population.__new__(common.Population)
+        self.p.first_id = 42
+        self.p.last_id = 162
+
+    def test_id_to_index(self):
+        self.assertEqual(self.p.id_to_index(42), 0)
+        self.assertEqual(self.p.id_to_index(45), 3)
+        self.assertRaises(AssertionError, self.p.id_to_index, 163)
+
+    def test_id_to_index_with_array(self):
+        self.assertEqual(self.p.id_to_index(numpy.array([45, 52, 161])).tolist(),
+                         [3, 10, 119])
+        self.assertRaises(AssertionError, self.p.id_to_index, numpy.array([41, 45]))
+
+
+class PopulationParametersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.params = common.PopulationParameters(cells.IF_curr_alpha, 10)
+
+    def test_defaults(self):
+        # one array per float parameter, seeded with the class default
+        self.assertEqual(self.params.names,
+                         tuple(sorted(cells.IF_curr_alpha.default_parameters)))
+        assert 'tau_m' in self.params
+        assert 'foo' not in self.params
+        self.assertEqual(self.params['tau_m'].tolist(),
+                         [cells.IF_curr_alpha.default_parameters['tau_m']]*10)
+
+    def test_setitem(self):
+        self.params['tau_m'] = 15.0
+        self.assertEqual(self.params['tau_m'].tolist(), [15.0]*10)
+        self.params['tau_m'] = numpy.arange(10.0)
+        self.assertEqual(self.params['tau_m'].tolist(), list(range(10)))
+        self.assertRaises(common.NonExistentParameterError,
+                          self.params.__setitem__, 'foo', 1.0)
+
+    def test_as_dict(self):
+        self.params['tau_m'] = numpy.arange(10.0)
+        d = self.params.as_dict(3)
+        self.assertEqual(sorted(d.keys()), list(self.params.names))
+        self.assertEqual(d['tau_m'], 3.0)
+
+
 class LowLevelAPITest(unittest.TestCase):
     
     def test_setup(self):
@@ -167,47 +225,132 @@ class LowLevelAPITest(unittest.TestCase):
         self.assertRaises(NotImplementedError, common.run, 10.0)
                
         
+class NotASequence(object):
+    """A dummy value type that Connector cannot interpret as weights/delays."""
+    pass
+
+
 class ConnectorTest(unittest.TestCase):
 
-    def test_get_weights(self):
-        c1 = connectors.Connector(delays=0.5, weights=0.5)
-        self.assertEqual(c1.get_weights(3).tolist(), [0.5,0.5,0.5])
-        c2 = connectors.Connector(delays=0.5, weights="foo")
-        self.assertRaises(ValueError, c2.get_weights, 3)
-        class A(object): pass
-        c3 = connectors.Connector(delays=0.5, weights=A())
-        self.assertRaises(Exception,c3.get_weights, 3)
+    def check_value_sequence(self, name):
+        # get_weights() and get_delays() implement the same sequence logic,
+        # so both tests are driven from the same set of cases
+        def make(value):
+            if name == 'weights':
+                return connectors.Connector(delays=0.5, weights=value)
+            else:
+                return connectors.Connector(weights=0.5, delays=value)
+        def get(connector, n):
+            return getattr(connector, 'get_%s' % name)(n)
+        self.assertEqual(get(make(0.5), 3).tolist(), [0.5,0.5,0.5])
+        self.assertRaises(ValueError, get, make("foo"), 3)
+        self.assertRaises(Exception, get, make(NotASequence()), 3)
         rd = random.RandomDistribution('gamma', [0.5,0.5])
-        c4 = connectors.Connector(delays=0.5, weights=rd)
-        w = c4.get_weights(3)
-        self.assertEqual(len(w), 3)
-        self.assertNotEqual(w[0], w[1])
-        
+        values = get(make(rd), 3)
+        self.assertEqual(len(values), 3)
+        self.assertNotEqual(values[0], values[1])
+        self.assertEqual(get(make([1.0, 2.0, 3.0]), 3).tolist(), [1.0, 2.0, 3.0])
+
+    def test_get_weights(self):
+        self.check_value_sequence('weights')
+
     def test_get_delays(self):
-        c1 = connectors.Connector(delays=0.5, weights=0.5)
-        self.assertEqual(c1.get_delays(3).tolist(), [0.5,0.5,0.5])
-        c2 = connectors.Connector(weights=0.5, delays="foo")
-        self.assertRaises(ValueError, c2.get_delays, 3)
-        class A(object): pass
-        c3 = connectors.Connector(weights=0.5, delays=A())
-        self.assertRaises(Exception,c3.get_delays, 3)
-        rd = random.RandomDistribution('gamma', [0.5,0.5])
-        c4 = connectors.Connector(weights=0.5, delays=rd)
-        d = c4.get_delays(3)
-        self.assertEqual(len(d), 3)
-        self.assertNotEqual(d[0], d[1])
-        c5 = connectors.Connector(weights=0.5, delays=[1.0, 2.0, 3.0])
-        self.assertEqual(c5.get_delays(3).tolist(), [1.0, 2.0, 3.0]) 
-    
+        self.check_value_sequence('delays')
+
+
     def test_connect(self):
         c = connectors.Connector(delays=0.5)
         self.assertRaises(NotImplementedError, c.connect, 'foo')
 
+
+class MockConnectionManager(object):
+    """Records connect() calls instead of passing them to a simulator."""
+
+    def __init__(self):
+        self.connections = []
+
+    def connect(self, source, targets, weights, delays):
+        assert len(targets) == len(weights) == len(delays)
+        self.connections.extend((source, target) for target in targets)
+
+
+class MockPopulation(object):
+    """The minimal Population interface needed by ProbabilisticConnector."""
+
+    def __init__(self, first_id, size):
+        self.label = "mock"
+        self.size = size
+        self.all_cells = numpy.arange(first_id, first_id + size)
+        self.local_cells = self.all_cells
+        self._mask_local = numpy.ones((size,), bool)
+
+    def index(self, n):
+        return self.all_cells[n]
+
+
+class MockProjection(object):
+    synapse_type = "excitatory"
+
+    def __init__(self, pre, post, rng):
+        self.pre = pre
+        self.post = post
+        self.rng = rng
+        self.connection_manager = MockConnectionManager()
+
+
+class ProbabilisticConnectFastTest(unittest.TestCase):
+    """Tests for the geometric-skip fast path of ProbabilisticConnector."""
+
+    def setUp(self):
+        self.pre = MockPopulation(100, 50)
+        self.post = MockPopulation(1000, 40)
+        self.rng = random.NumpyRNG(seed=28754)
+
+    def test_guard(self):
+        prj = MockProjection(self.pre, self.post, self.rng)
+        c = connectors.FixedProbabilityConnector(0.1, weights=0.1, delays=0.5)
+        assert c._fast_connect_possible(prj, 0.1)
+        # random weights need the dense draw to keep the stream ordering
+        rd = random.RandomDistribution('uniform', [0.0, 0.1], rng=self.rng)
+        c = connectors.FixedProbabilityConnector(0.1, weights=rd, delays=0.5)
+        assert not c._fast_connect_possible(prj, 0.1)
+        # so does a distributed RNG
+        prj.rng = random.NumpyRNG(seed=28754, rank=0, num_processes=2)
+        c = connectors.FixedProbabilityConnector(0.1, weights=0.1, delays=0.5)
+        assert not c._fast_connect_possible(prj, 0.1)
+
+    def test_geometric_sample(self):
+        positions = connectors.geometric_sample(self.rng.rng, 0.1, 10000)
+        assert (numpy.diff(positions) > 0).all() # sorted, no duplicates
+        assert positions.min() >= 0
+        assert positions.max() < 10000
+        assert abs(len(positions) - 1000) < 120 # ~4 sigma
+
+    def test_connection_statistics(self):
+        p = 0.1
+        prj = MockProjection(self.pre, self.post, self.rng)
+        connectors.FixedProbabilityConnector(p, weights=0.1, delays=0.5).connect(prj)
+        sources, targets = zip(*prj.connection_manager.connections)
+        assert set(sources) <= set(self.pre.all_cells.tolist())
+        assert set(targets) <= set(self.post.all_cells.tolist())
+        n_expected = p*self.pre.size*self.post.size
+        self.assertTrue(abs(len(sources) - n_expected) < 60, # ~4 sigma
+                        "got %d connections, expected ~%g" % (len(sources), n_expected))
+
+    def test_no_self_connections(self):
+        prj = MockProjection(self.pre, self.pre, self.rng)
+        c = connectors.FixedProbabilityConnector(0.5, allow_self_connections=False,
+                                                 weights=0.1, delays=0.5)
+        c.connect(prj)
+        for source, target in prj.connection_manager.connections:
+            self.assertNotEqual(source, target)
+
+
 class SynapticPlasticityTest(unittest.TestCase):
     
     def test_describe(self):
         s = common.SynapseDynamics()
-        assert isinstance(s.describe(), basestring)
+        assert isinstance(s.describe(), str)
         assert isinstance(s.describe(template=None), dict)
        
     def test_stubs(self):
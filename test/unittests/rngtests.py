@@ -4,10 +4,6 @@ $Id$
 """
 from __future__ import division
 
-from builtins import next
-from builtins import str
-from builtins import range
-from past.utils import old_div
 import pyNN.random as random
 import numpy
 import unittest
@@ -21,9 +17,16 @@ def assert_arrays_almost_equal(a, b, threshold):
 # ==============================================================================
 class SimpleTests(unittest.TestCase):
     """Simple tests on a single RNG function."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        # construct the RNG objects once for the whole class; setUp reseeds
+        # them, so each test still starts from a known generator state
+        cls.rnglist = [random.NumpyRNG(seed=987),random.GSLRNG(seed=654)]
+
     def setUp(self):
-        self.rnglist = [random.NumpyRNG(seed=987),random.GSLRNG(seed=654)]
+        self.rnglist[0].rng.seed(987)
+        self.rnglist[1].rng.set(654)
     
     def testNextOne(self):
         """Calling next() with no arguments or with n=1 should return a float."""
@@ -59,8 +62,8 @@ class ParallelTests(unittest.TestCase):
             rng1 = rng_type(seed=1000, rank=1, num_processes=2, parallel_safe=False)
             draw0 = rng0.next(5)
             draw1 = rng1.next(5)
-            self.assertEqual(len(draw0), old_div(5,2)+1)
-            self.assertEqual(len(draw1), old_div(5,2)+1)
+            self.assertEqual(len(draw0), 5//2+1)
+            self.assertEqual(len(draw1), 5//2+1)
             self.assertNotEqual(draw0.tolist(), draw1.tolist())
 
     def test_parallel_safe(self):
@@ -89,9 +92,15 @@ class NativeRNGTests(unittest.TestCase):
         str(rng)
 
 class RandomDistributionTests(unittest.TestCase):
-    
+
+    @classmethod
+    def setUpClass(cls):
+        # see SimpleTests: shared RNGs, reseeded before each test
+        cls.rnglist = [random.NumpyRNG(seed=9876),random.GSLRNG(seed=6543)]
+
     def setUp(self):
-        self.rnglist = [random.NumpyRNG(seed=9876),random.GSLRNG(seed=6543)]
+        self.rnglist[0].rng.seed(9876)
+        self.rnglist[1].rng.set(6543)
         
     def test_uniform(self):
         rd = random.RandomDistribution(distribution='uniform', parameters=[-1.0, 3.0], rng=self.rnglist[0]) 
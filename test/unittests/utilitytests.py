@@ -1,7 +1,8 @@
-from past.builtins import basestring
 from pyNN import utility
 import unittest
 import os
+import shutil
+import tempfile
 
 class ColouredOutputTests(unittest.TestCase):
     
@@ -25,9 +26,15 @@ class GetArgTests(unittest.TestCase):
 class InitLoggingTests(unittest.TestCase):
     
     def test_initlogging_debug(self):
-        utility.init_logging("test.log", debug=True, num_processes=2, rank=99)
-        assert os.path.exists("test.log.99")
-        os.remove("test.log.99")
+        # log to a private temporary directory, so that concurrent test runs
+        # do not race on the file and nothing is left in the working directory
+        tmpdir = tempfile.mkdtemp()
+        try:
+            utility.init_logging(os.path.join(tmpdir, "test.log"),
+                                 debug=True, num_processes=2, rank=99)
+            assert os.path.exists(os.path.join(tmpdir, "test.log.99"))
+        finally:
+            shutil.rmtree(tmpdir)
 
 import time
 
@@ -35,9 +42,9 @@ class TimerTest(unittest.TestCase):
     
     def test_timer(self):
         timer = utility.Timer()
-        time.sleep(0.1)
+        time.sleep(0.01) # just long enough to be sure some time has passed
         assert timer.elapsedTime() > 0
-        assert isinstance(timer.elapsedTime(format='long'), basestring)
+        assert isinstance(timer.elapsedTime(format='long'), str)
         timer.reset()
 
 # ==============================================================================